@@ -13,16 +13,45 @@ import random
 import string
 import re
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterable, Tuple
 import uuid
 from pathlib import Path
 import shutil
 from datetime import timedelta
 import gzip
 import traceback
+from dataclasses import dataclass
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 logger = logging.getLogger(__name__)
 
+
+def _dumps_json(data: Any) -> bytes:
+    """Serializa dados em JSON compacto (bytes UTF-8), usando orjson quando disponível"""
+    if HAS_ORJSON:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, default=str).encode("utf-8")
+
+
+def _embed_json(envelope: Dict[str, Any], key: str, raw_json: bytes) -> bytes:
+    """Serializa o envelope inserindo em `key` um payload JSON já codificado, sem reserializá-lo"""
+    head = _dumps_json({k: v for k, v in envelope.items() if k != key})
+    body = b'{' + _dumps_json(key) + b':' + raw_json
+    return body + (b',' + head[1:] if len(head) > 2 else b'}')
+
+
+@dataclass(frozen=True)
+class DadosSerializados:
+    """Dados de uma etapa já limpos e serializados (ver serializar_json)"""
+    conteudo: bytes  # JSON dos dados limpos
+    tamanho: int  # Mesmo critério de tamanho_dados do caminho padrão
+
+
 class AutoSaveManager:
     """Gerenciador de salvamento automático ultra-robusto"""
 
@@ -124,6 +153,19 @@ class AutoSaveManager:
         logger.info(f"🚀 Sessão iniciada: {session_id}" + (f" (Segmento: {segmento})" if segmento else ""))
         return session_id
 
+    def serializar_json(self, dados: Any) -> Optional[DadosSerializados]:
+        """Limpa e serializa dados uma única vez para reutilização em várias chamadas de salvar_etapa"""
+        # Mesma limpeza do caminho padrão (profundidade, listas e chaves excluídas)
+        clean_dados = self._remove_circular_references_safe(dados)
+        try:
+            return DadosSerializados(
+                conteudo=_dumps_json(clean_dados),
+                tamanho=len(str(clean_dados)) if clean_dados else 0
+            )
+        except (ValueError, TypeError) as e:
+            logger.warning(f"⚠️ Dados não serializáveis, salvamento seguirá pelo caminho padrão: {e}")
+            return None
+
     def salvar_etapa(
         self,
         nome_etapa: str,
@@ -131,7 +173,8 @@ class AutoSaveManager:
         status: str = "sucesso",
         timestamp: Optional[float] = None,
         categoria: str = "geral",
-        session_id: Optional[str] = None # Adicionado para aceitar session_id diretamente
+        session_id: Optional[str] = None, # Adicionado para aceitar session_id diretamente
+        dados_serializados: Optional[DadosSerializados] = None # `dados` já limpos e serializados (ver serializar_json)
     ) -> str:
         """Salva etapa imediatamente com timestamp único"""
 
@@ -142,25 +185,72 @@ class AutoSaveManager:
             return "" # Retorna string vazia se não houver session_id
 
         timestamp = timestamp or time.time()
-        timestamp_str = datetime.fromtimestamp(timestamp).strftime("%Y%m%d_%H%M%S_%f")[:-3]
+        save_dir = self._resolver_diretorio(categoria, current_session_id)
+
+        return self._gravar_etapa(save_dir, nome_etapa, dados, status, timestamp, categoria, current_session_id, dados_serializados)
+
+    def salvar_etapas_lote(
+        self,
+        etapas: Iterable[Tuple[str, Any, str, Optional[DadosSerializados]]],
+        status: str = "sucesso",
+        session_id: Optional[str] = None
+    ) -> List[str]:
+        """Salva um lote de etapas (nome, dados, categoria, dados_serializados) com timestamp e diretórios compartilhados"""
+
+        current_session_id = session_id if session_id is not None else self.current_session_id
+        if not current_session_id:
+            logger.error("Nenhuma sessão ativa ou fornecida para salvar o lote de etapas.")
+            return []
+
+        timestamp = time.time()
+        diretorios = {}
+        caminhos = []
+
+        for nome_etapa, dados, categoria, dados_serializados in etapas:
+            save_dir = diretorios.get(categoria)
+            if save_dir is None:
+                save_dir = diretorios[categoria] = self._resolver_diretorio(categoria, current_session_id)
+            caminhos.append(
+                self._gravar_etapa(save_dir, nome_etapa, dados, status, timestamp, categoria, current_session_id, dados_serializados)
+            )
 
-        # Determina diretório baseado na categoria
-        if categoria in self.subdirs:
-            save_dir = self.subdirs[categoria]
-        else:
-            save_dir = self.base_dir
+        logger.info(f"💾 Lote de {len(caminhos)} etapas salvo ({len(diretorios)} diretórios)")
+        return caminhos
 
-        # Se há sessão ativa, cria subdiretório
-        save_dir = save_dir / current_session_id
+    def _resolver_diretorio(self, categoria: str, session_id: str) -> Path:
+        """Determina e cria o diretório da sessão para a categoria"""
+        save_dir = self.subdirs.get(categoria, self.base_dir) / session_id
         save_dir.mkdir(exist_ok=True)
+        return save_dir
+
+    def _gravar_etapa(
+        self,
+        save_dir: Path,
+        nome_etapa: str,
+        dados: Any,
+        status: str,
+        timestamp: float,
+        categoria: str,
+        current_session_id: str,
+        dados_serializados: Optional[DadosSerializados] = None
+    ) -> str:
+        """Grava os arquivos TXT (e backup JSON, quando aplicável) de uma etapa"""
+
+        timestamp_str = datetime.fromtimestamp(timestamp).strftime("%Y%m%d_%H%M%S_%f")[:-3]
 
         # Nome do arquivo TXT para dados limpos
         filename = f"{nome_etapa}_{timestamp_str}.txt"
         filepath = save_dir / filename
 
         try:
-            # CORREÇÃO CRÍTICA: Limpa referências circulares ANTES de tentar salvar
-            clean_dados = self._remove_circular_references_safe(dados)
+            if dados_serializados is not None:
+                # Dados já limpos e serializados pelo chamador: dispensa nova limpeza e reserialização
+                clean_dados = None
+                tamanho_dados = dados_serializados.tamanho
+            else:
+                # CORREÇÃO CRÍTICA: Limpa referências circulares ANTES de tentar salvar
+                clean_dados = self._remove_circular_references_safe(dados)
+                tamanho_dados = len(str(clean_dados)) if clean_dados else 0
 
             # Prepara dados para salvamento
             save_data = {
@@ -172,7 +262,7 @@ class AutoSaveManager:
                 "session_id": current_session_id,
                 "analysis_id": self.analysis_id,
                 "categoria": categoria,
-                "tamanho_dados": len(str(clean_dados)) if clean_dados else 0
+                "tamanho_dados": tamanho_dados
             }
 
             # Salva arquivo TXT limpo (sem dados brutos JSON)
@@ -207,13 +297,14 @@ class AutoSaveManager:
             logger.info(f"💾 Etapa '{nome_etapa}' salva: {filepath}")
 
             # Salva também backup JSON para dados críticos
-            if categoria in ['analise_completa', 'pesquisa_web'] and len(str(clean_dados)) > 1000:
+            if categoria in ['analise_completa', 'pesquisa_web'] and tamanho_dados > 1000:
                 json_filepath = save_dir / f"{nome_etapa}_{timestamp_str}.json"
                 try:
-                    # Tenta serializar para JSON para verificar se há referências circulares
-                    json.dumps(save_data, default=str)
-                    with open(json_filepath, "w", encoding="utf-8") as f:
-                        json.dump(save_data, f, ensure_ascii=False, indent=2, default=str)
+                    # Serializa uma única vez; falha aqui indica dados não serializáveis
+                    if dados_serializados is not None:
+                        json_payload = _embed_json(save_data, "dados", dados_serializados.conteudo)
+                    else:
+                        json_payload = _dumps_json(save_data)
                 except (ValueError, TypeError) as json_error:
                     logger.warning(f"⚠️ Não foi possível salvar JSON para {nome_etapa}: {json_error}")
                     # Salva versão simplificada
@@ -224,8 +315,9 @@ class AutoSaveManager:
                         "session_id": current_session_id,
                         "error": f"Dados simplificados devido a: {str(json_error)}"
                     }
-                    with open(json_filepath, "w", encoding="utf-8") as f:
-                        json.dump(simplified_data, f, ensure_ascii=False, indent=2)
+                    json_payload = _dumps_json(simplified_data)
+                with open(json_filepath, "wb") as f:
+                    f.write(json_payload)
 
             return str(filepath)
 
@@ -581,12 +673,22 @@ class AutoSaveManager:
 auto_save_manager = AutoSaveManager()
 
 # Função de conveniência
-def salvar_etapa(nome_etapa: str, dados: Any, status: str = "sucesso", categoria: str = "geral", session_id: Optional[str] = None) -> str:
+def salvar_etapa(nome_etapa: str, dados: Any, status: str = "sucesso", categoria: str = "geral", session_id: Optional[str] = None, dados_serializados: Optional[DadosSerializados] = None) -> str:
     """Função de conveniência para salvamento rápido"""
     # Se session_id não for fornecido, tenta usar o current_session_id da instância global
     if session_id is None:
         session_id = auto_save_manager.current_session_id
-    return auto_save_manager.salvar_etapa(nome_etapa, dados, status, categoria=categoria, session_id=session_id)
+    return auto_save_manager.salvar_etapa(nome_etapa, dados, status, categoria=categoria, session_id=session_id, dados_serializados=dados_serializados)
+
+def salvar_etapas_lote(etapas: Iterable[Tuple[str, Any, str, Optional[DadosSerializados]]], status: str = "sucesso", session_id: Optional[str] = None) -> List[str]:
+    """Função de conveniência para salvamento de várias etapas de uma vez"""
+    if session_id is None:
+        session_id = auto_save_manager.current_session_id
+    return auto_save_manager.salvar_etapas_lote(etapas, status, session_id=session_id)
+
+def serializar_json(dados: Any) -> Optional[DadosSerializados]:
+    """Função de conveniência para serializar dados reutilizados em várias etapas"""
+    return auto_save_manager.serializar_json(dados)
 
 def salvar_erro(etapa: str, erro: Exception, contexto: Dict[str, Any] = None, session_id: Optional[str] = None) -> str:
     """Função de conveniência para salvamento de erros"""
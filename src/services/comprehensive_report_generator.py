@@ -10,29 +10,178 @@ import os
 import logging
 import json
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-from services.auto_save_manager import salvar_etapa
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
+from services.auto_save_manager import salvar_etapas_lote, serializar_json
 
 logger = logging.getLogger(__name__)
 
+# Componentes obrigatórios do relatório final
+_REQUIRED_COMPONENTS: Tuple[str, ...] = (
+    'pesquisa_web_massiva',
+    'avatar_ultra_detalhado',
+    'drivers_mentais_customizados',
+    'provas_visuais_arsenal',
+    'sistema_anti_objecao',
+    'pre_pitch_invisivel',
+    'predicoes_futuro_detalhadas',
+    'analise_concorrencia',
+    'insights_exclusivos',
+    'palavras_chave_estrategicas',
+    'funil_vendas_otimizado'
+)
+
+# Componente -> categoria de salvamento (demais vão para 'analise_completa')
+_CATEGORY_MAP: Mapping[str, str] = MappingProxyType({
+    'drivers_mentais_customizados': 'drivers_mentais',
+    'provas_visuais_arsenal': 'provas_visuais',
+    'sistema_anti_objecao': 'anti_objecao',
+    'pre_pitch_invisivel': 'pre_pitch'
+})
+
+# Seções sem dependência dos dados de entrada: montadas uma única vez e
+# compartilhadas entre relatórios (somente leitura, não devem ser mutadas)
+_COMPETITION_TEMPLATE = {
+    "concorrentes_principais": [
+        "Líder de mercado",
+        "Challenger principal", 
+        "Concorrente emergente"
+    ],
+    "analise_posicionamento": {
+        "pontos_fortes": ["Qualidade", "Preço", "Atendimento"],
+        "pontos_fracos": ["Inovação", "Agilidade", "Personalização"],
+        "oportunidades": ["Nicho específico", "Tecnologia", "Experiência"]
+    },
+    "estrategias_diferenciacao": [
+        "Proposta de valor única",
+        "Experiência superior",
+        "Inovação constante"
+    ]
+}
+
+_EXCLUSIVE_INSIGHTS_TEMPLATE = {
+    "insights_estrategicos": [
+        "Padrão comportamental não explorado",
+        "Janela de oportunidade temporal",
+        "Vantagem competitiva sustentável"
+    ],
+    "descobertas_unicas": [
+        "Necessidade latente identificada",
+        "Segmento sub-atendido",
+        "Inovação disruptiva possível"
+    ],
+    "recomendacoes_acao": [
+        "Priorizar segmento específico",
+        "Desenvolver solução inovadora",
+        "Acelerar entrada no mercado"
+    ]
+}
+
+_KEYWORDS_TEMPLATE = {
+    "palavras_chave_primarias": [
+        "Termo principal 1",
+        "Termo principal 2",
+        "Termo principal 3"
+    ],
+    "palavras_chave_secundarias": [
+        "Termo relacionado 1",
+        "Termo relacionado 2", 
+        "Termo relacionado 3"
+    ],
+    "palavras_long_tail": [
+        "Frase específica 1",
+        "Frase específica 2",
+        "Frase específica 3"
+    ],
+    "oportunidades_seo": [
+        "Gap de conteúdo identificado",
+        "Palavras com baixa concorrência",
+        "Termos emergentes"
+    ]
+}
+
+_SALES_FUNNEL_TEMPLATE = {
+    "etapas_funil": {
+        "consciencia": {
+            "objetivo": "Despertar interesse",
+            "estrategias": ["Content marketing", "SEO", "Social media"],
+            "metricas": ["Impressões", "Cliques", "Engajamento"]
+        },
+        "consideracao": {
+            "objetivo": "Educar e nutrir",
+            "estrategias": ["E-books", "Webinars", "Email marketing"],
+            "metricas": ["Downloads", "Participação", "Abertura"]
+        },
+        "decisao": {
+            "objetivo": "Converter em venda",
+            "estrategias": ["Demos", "Trials", "Consultoria"],
+            "metricas": ["Conversões", "Vendas", "ROI"]
+        }
+    },
+    "otimizacoes_recomendadas": [
+        "Personalizar mensagens",
+        "Automatizar follow-up",
+        "Segmentar audiences"
+    ],
+    "taxa_conversao_esperada": "15-25%"
+}
+
+_FINAL_CONSOLIDATION_TEMPLATE = {
+    "resumo_executivo": "Análise completa realizada com todos os componentes obrigatórios",
+    "principais_achados": [
+        "Avatar detalhado mapeado",
+        "22 drivers mentais identificados",
+        "Sistema anti-objeção completo",
+        "Predições futuras estruturadas"
+    ],
+    "proximos_passos": [
+        "Implementar estratégias identificadas",
+        "Testar drivers mentais",
+        "Monitorar métricas de conversão"
+    ],
+    "garantia_completude": "100% dos componentes obrigatórios incluídos"
+}
+
+@lru_cache(maxsize=32)
+def _metrics_for(present: frozenset, required: Tuple[str, ...]) -> MappingProxyType:
+    """Calcula (e memoiza) métricas de completude para um conjunto de componentes"""
+    components_present = len(present)
+    total_required = len(required)
+    missing = frozenset(required).difference(present)
+    
+    return MappingProxyType({
+        "componentes_incluidos": components_present,
+        "componentes_obrigatorios": total_required,
+        "taxa_completude": f"{(components_present/total_required)*100:.1f}%",
+        "status": "COMPLETO" if components_present >= total_required else "INCOMPLETO",
+        # Mantém a ordem de `required` apenas quando há componentes faltando
+        "componentes_faltantes": tuple(comp for comp in required if comp in missing) if missing else ()
+    })
+
+
 class ComprehensiveReportGenerator:
     """Gerador de relatório final completo com todos os componentes obrigatórios"""
     
+    # Componente do relatório -> método gerador, na ordem de montagem
+    _COMPONENT_BUILDERS = (
+        ("pesquisa_web_massiva", "_generate_web_research_section"),
+        ("avatar_ultra_detalhado", "_generate_avatar_section"),
+        ("drivers_mentais_customizados", "_generate_drivers_section"),
+        ("provas_visuais_arsenal", "_generate_visual_proofs_section"),
+        ("sistema_anti_objecao", "_generate_anti_objection_section"),
+        ("pre_pitch_invisivel", "_generate_pre_pitch_section"),
+        ("predicoes_futuro_detalhadas", "_generate_future_predictions_section"),
+        ("analise_concorrencia", "_generate_competition_analysis"),
+        ("insights_exclusivos", "_generate_exclusive_insights"),
+        ("palavras_chave_estrategicas", "_generate_keywords_analysis"),
+        ("funil_vendas_otimizado", "_generate_sales_funnel"),
+    )
+    
     def __init__(self):
         """Inicializa gerador de relatório completo"""
-        self.required_components = [
-            'pesquisa_web_massiva',
-            'avatar_ultra_detalhado', 
-            'drivers_mentais_customizados',
-            'provas_visuais_arsenal',
-            'sistema_anti_objecao',
-            'pre_pitch_invisivel',
-            'predicoes_futuro_detalhadas',
-            'analise_concorrencia',
-            'insights_exclusivos',
-            'palavras_chave_estrategicas',
-            'funil_vendas_otimizado'
-        ]
+        # Alias mantido para compatibilidade
+        self.required_components = _REQUIRED_COMPONENTS
         
         logger.info("Comprehensive Report Generator inicializado")
     
@@ -59,38 +208,11 @@ class ComprehensiveReportGenerator:
                 "componentes_analise": {}
             }
             
-            # COMPONENTE 1: PESQUISA WEB MASSIVA
-            complete_report["componentes_analise"]["pesquisa_web_massiva"] = self._generate_web_research_section(analysis_data)
-            
-            # COMPONENTE 2: AVATAR ULTRA-DETALHADO
-            complete_report["componentes_analise"]["avatar_ultra_detalhado"] = self._generate_avatar_section(analysis_data)
-            
-            # COMPONENTE 3: DRIVERS MENTAIS CUSTOMIZADOS
-            complete_report["componentes_analise"]["drivers_mentais_customizados"] = self._generate_drivers_section(analysis_data)
-            
-            # COMPONENTE 4: PROVAS VISUAIS ARSENAL
-            complete_report["componentes_analise"]["provas_visuais_arsenal"] = self._generate_visual_proofs_section(analysis_data)
-            
-            # COMPONENTE 5: SISTEMA ANTI-OBJEÇÃO
-            complete_report["componentes_analise"]["sistema_anti_objecao"] = self._generate_anti_objection_section(analysis_data)
-            
-            # COMPONENTE 6: PRÉ-PITCH INVISÍVEL
-            complete_report["componentes_analise"]["pre_pitch_invisivel"] = self._generate_pre_pitch_section(analysis_data)
-            
-            # COMPONENTE 7: PREDIÇÕES FUTURAS
-            complete_report["componentes_analise"]["predicoes_futuro_detalhadas"] = self._generate_future_predictions_section(analysis_data)
-            
-            # COMPONENTE 8: ANÁLISE DE CONCORRÊNCIA
-            complete_report["componentes_analise"]["analise_concorrencia"] = self._generate_competition_analysis(analysis_data)
-            
-            # COMPONENTE 9: INSIGHTS EXCLUSIVOS
-            complete_report["componentes_analise"]["insights_exclusivos"] = self._generate_exclusive_insights(analysis_data)
-            
-            # COMPONENTE 10: PALAVRAS-CHAVE ESTRATÉGICAS
-            complete_report["componentes_analise"]["palavras_chave_estrategicas"] = self._generate_keywords_analysis(analysis_data)
-            
-            # COMPONENTE 11: FUNIL DE VENDAS OTIMIZADO
-            complete_report["componentes_analise"]["funil_vendas_otimizado"] = self._generate_sales_funnel(analysis_data)
+            # COMPONENTES 1-11: montados de uma vez a partir da tabela de geradores
+            complete_report["componentes_analise"] = {
+                name: getattr(self, builder)(analysis_data)
+                for name, builder in self._COMPONENT_BUILDERS
+            }
             
             # SEÇÃO DE CONSOLIDAÇÃO FINAL
             complete_report["consolidacao_final"] = self._generate_final_consolidation(complete_report)
@@ -252,157 +374,54 @@ class ComprehensiveReportGenerator:
     
     def _generate_competition_analysis(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Gera análise de concorrência completa"""
-        return {
-            "concorrentes_principais": [
-                "Líder de mercado",
-                "Challenger principal", 
-                "Concorrente emergente"
-            ],
-            "analise_posicionamento": {
-                "pontos_fortes": ["Qualidade", "Preço", "Atendimento"],
-                "pontos_fracos": ["Inovação", "Agilidade", "Personalização"],
-                "oportunidades": ["Nicho específico", "Tecnologia", "Experiência"]
-            },
-            "estrategias_diferenciacao": [
-                "Proposta de valor única",
-                "Experiência superior",
-                "Inovação constante"
-            ]
-        }
+        return _COMPETITION_TEMPLATE
     
     def _generate_exclusive_insights(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Gera insights exclusivos da análise"""
-        return {
-            "insights_estrategicos": [
-                "Padrão comportamental não explorado",
-                "Janela de oportunidade temporal",
-                "Vantagem competitiva sustentável"
-            ],
-            "descobertas_unicas": [
-                "Necessidade latente identificada",
-                "Segmento sub-atendido",
-                "Inovação disruptiva possível"
-            ],
-            "recomendacoes_acao": [
-                "Priorizar segmento específico",
-                "Desenvolver solução inovadora",
-                "Acelerar entrada no mercado"
-            ]
-        }
+        return _EXCLUSIVE_INSIGHTS_TEMPLATE
     
     def _generate_keywords_analysis(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Gera análise de palavras-chave estratégicas"""
-        return {
-            "palavras_chave_primarias": [
-                "Termo principal 1",
-                "Termo principal 2",
-                "Termo principal 3"
-            ],
-            "palavras_chave_secundarias": [
-                "Termo relacionado 1",
-                "Termo relacionado 2", 
-                "Termo relacionado 3"
-            ],
-            "palavras_long_tail": [
-                "Frase específica 1",
-                "Frase específica 2",
-                "Frase específica 3"
-            ],
-            "oportunidades_seo": [
-                "Gap de conteúdo identificado",
-                "Palavras com baixa concorrência",
-                "Termos emergentes"
-            ]
-        }
+        return _KEYWORDS_TEMPLATE
     
     def _generate_sales_funnel(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Gera funil de vendas otimizado"""
-        return {
-            "etapas_funil": {
-                "consciencia": {
-                    "objetivo": "Despertar interesse",
-                    "estrategias": ["Content marketing", "SEO", "Social media"],
-                    "metricas": ["Impressões", "Cliques", "Engajamento"]
-                },
-                "consideracao": {
-                    "objetivo": "Educar e nutrir",
-                    "estrategias": ["E-books", "Webinars", "Email marketing"],
-                    "metricas": ["Downloads", "Participação", "Abertura"]
-                },
-                "decisao": {
-                    "objetivo": "Converter em venda",
-                    "estrategias": ["Demos", "Trials", "Consultoria"],
-                    "metricas": ["Conversões", "Vendas", "ROI"]
-                }
-            },
-            "otimizacoes_recomendadas": [
-                "Personalizar mensagens",
-                "Automatizar follow-up",
-                "Segmentar audiences"
-            ],
-            "taxa_conversao_esperada": "15-25%"
-        }
+        return _SALES_FUNNEL_TEMPLATE
     
     def _generate_final_consolidation(self, report: Dict[str, Any]) -> Dict[str, Any]:
         """Gera consolidação final do relatório"""
-        return {
-            "resumo_executivo": "Análise completa realizada com todos os componentes obrigatórios",
-            "principais_achados": [
-                "Avatar detalhado mapeado",
-                "22 drivers mentais identificados",
-                "Sistema anti-objeção completo",
-                "Predições futuras estruturadas"
-            ],
-            "proximos_passos": [
-                "Implementar estratégias identificadas",
-                "Testar drivers mentais",
-                "Monitorar métricas de conversão"
-            ],
-            "garantia_completude": "100% dos componentes obrigatórios incluídos"
-        }
+        return _FINAL_CONSOLIDATION_TEMPLATE
     
     def _calculate_completeness_metrics(self, report: Dict[str, Any]) -> Dict[str, Any]:
         """Calcula métricas de completude do relatório"""
-        components_present = len(report.get('componentes_analise', {}))
-        total_required = len(self.required_components)
+        present = frozenset(report.get('componentes_analise', {}))
+        metrics = _metrics_for(present, _REQUIRED_COMPONENTS)
         
-        return {
-            "componentes_incluidos": components_present,
-            "componentes_obrigatorios": total_required,
-            "taxa_completude": f"{(components_present/total_required)*100:.1f}%",
-            "status": "COMPLETO" if components_present >= total_required else "INCOMPLETO",
-            "componentes_faltantes": [
-                comp for comp in self.required_components 
-                if comp not in report.get('componentes_analise', {})
-            ]
-        }
+        # Cópia mutável: o resultado memoizado é compartilhado entre relatórios
+        return {**metrics, "componentes_faltantes": list(metrics["componentes_faltantes"])}
     
     def _save_complete_report(self, report: Dict[str, Any], session_id: str):
         """Salva relatório completo em múltiplas categorias"""
         try:
-            # Salva como relatório final
-            salvar_etapa("relatorio_final_completo", report, categoria="relatorios_finais", session_id=session_id)
-            
-            # Salva na análise completa
-            salvar_etapa("analise_completa_final", report, categoria="analise_completa", session_id=session_id)
-            
-            # Salva cada componente individualmente
-            for component_name, component_data in report.get('componentes_analise', {}).items():
-                category_map = {
-                    'drivers_mentais_customizados': 'drivers_mentais',
-                    'provas_visuais_arsenal': 'provas_visuais', 
-                    'sistema_anti_objecao': 'anti_objecao',
-                    'pre_pitch_invisivel': 'pre_pitch'
-                }
-                
-                category = category_map.get(component_name, 'analise_completa')
-                salvar_etapa(f"componente_{component_name}", component_data, categoria=category, session_id=session_id)
+            salvar_etapas_lote(self._iter_save_entries(report), session_id=session_id)
             
             logger.info("✅ Relatório completo salvo em todas as categorias")
             
         except Exception as e:
             logger.error(f"❌ Erro ao salvar relatório completo: {e}")
     
+    def _iter_save_entries(self, report: Dict[str, Any]):
+        """Gera as entradas do lote de salvamento, serializando cada uma sob demanda"""
+        # Relatório final e análise completa compartilham os mesmos bytes
+        full_json = serializar_json(report)
+        yield ("relatorio_final_completo", report, "relatorios_finais", full_json)
+        yield ("analise_completa_final", report, "analise_completa", full_json)
+        
+        # Cada componente individualmente, serializado logo antes de ser gravado
+        for component_name, component_data in report.get('componentes_analise', {}).items():
+            category = _CATEGORY_MAP.get(component_name, 'analise_completa')
+            yield (f"componente_{component_name}", component_data, category, serializar_json(component_data))
+    
     def _generate_emergency_report(self, data: Dict[str, Any], session_id: str, error: str) -> Dict[str, Any]:
         """Gera relatório de emergência em caso de erro"""
         return {
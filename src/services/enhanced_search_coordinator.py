@@ -11,7 +11,7 @@ import time
 import asyncio
 from typing import Dict, List, Optional, Any
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from services.exa_client import exa_client
+from services.exa_client import get_exa_client, is_exa_configured
 from services.production_search_manager import production_search_manager
 from services.auto_save_manager import salvar_etapa, salvar_erro
 from services.mcp_supadata_manager import mcp_supadata_manager
@@ -27,7 +27,7 @@ class EnhancedSearchCoordinator:
 
     def __init__(self):
         """Inicializa coordenador de busca"""
-        self.exa_available = exa_client.is_available()
+        self.exa_available = is_exa_configured()
         self.google_available = bool(os.getenv('GOOGLE_SEARCH_KEY') and os.getenv('GOOGLE_CSE_ID'))
 
         logger.info(f"🔍 Enhanced Search Coordinator ULTRA-ROBUSTO - Exa: {self.exa_available}, Google: {self.google_available}")
@@ -45,12 +45,12 @@ class EnhancedSearchCoordinator:
     def _prepare_exa_neural_search(self, query: str) -> Dict[str, Any]:
         """Prepara busca neural com Exa"""
         try:
-            from services.exa_client import exa_client
+            from services.exa_client import get_exa_client
 
             # Otimiza query para busca neural
             neural_query = f"comprehensive analysis {query} market insights trends"
 
-            results = exa_client.search_comprehensive(neural_query, num_results=10)
+            results = get_exa_client().search_comprehensive(neural_query, num_results=10)
 
             return {
                 'provider': 'exa_neural',
@@ -80,7 +80,7 @@ class EnhancedSearchCoordinator:
             # Executa busca usando múltiplos provedores
             if self.exa_available:
                 try:
-                    exa_results = exa_client.search_comprehensive(query, num_results=10)
+                    exa_results = get_exa_client().search_comprehensive(query, num_results=10)
                     if exa_results and exa_results.get('results'):
                         results['search_results'].extend(exa_results['results'])
                         results['providers_used'].append('exa')
@@ -452,7 +452,7 @@ class EnhancedSearchCoordinator:
                 "startse.com", "revistapegn.globo.com", "epocanegocios.globo.com"
             ]
 
-            exa_response = exa_client.search(
+            exa_response = get_exa_client().search(
                 query=query,
                 num_results=20,  # Mais resultados para Exa
                 include_domains=include_domains,
@@ -686,7 +686,7 @@ class EnhancedSearchCoordinator:
             social_query = f"{query} site:twitter.com OR site:linkedin.com OR site:facebook.com"
 
             # Usa busca neural para melhor compreensão
-            exa_response = exa_client.search(
+            exa_response = get_exa_client().search(
                 query=social_query,
                 num_results=30,
                 type="neural",
@@ -6,42 +6,302 @@ Cliente para integração com Exa API para pesquisa avançada
 """
 
 import os
+import time
+import hashlib
 import logging
-import requests
 import json
-from typing import Dict, List, Optional, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, make_dataclass
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
-from exa_py import Exa
+
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
 
 logger = logging.getLogger(__name__)
 
+# Respostas da Exa são reaproveitadas por 24h
+_CACHE_TTL = 24 * 60 * 60
+
+
+# Campos lidos de cada resultado (snake_case; a API usa camelCase). Declarados uma única vez para
+# os dois decodificadores e aceitos sem validação de tipo: uma linha malformada não descarta a resposta
+_RESULT_FIELDS = ('url', 'id', 'title', 'text', 'score', 'published_date', 'author')
+
+
+def _camel(name: str) -> str:
+    """Converte um nome snake_case no campo camelCase correspondente da API"""
+    first, *rest = name.split('_')
+    return first + ''.join(part.title() for part in rest)
+
+
+if HAS_MSGSPEC:
+    ExaResult = msgspec.defstruct(
+        "ExaResult", [(name, Any, None) for name in _RESULT_FIELDS],
+        frozen=True, gc=False, rename="camel"
+    )
+
+    class ExaResponse(msgspec.Struct, frozen=True, gc=False, rename="camel"):
+        """Resposta de busca da Exa API"""
+        results: Optional[List[ExaResult]] = None
+        autoprompt_string: Any = None
+
+    # Decodificadores reutilizáveis: tipado para as buscas internas, genérico para o retorno bruto da API
+    _decode_response = msgspec.json.Decoder(ExaResponse).decode
+    _decode_json = msgspec.json.Decoder().decode
+else:
+    ExaResult = make_dataclass(
+        "ExaResult", [(name, Any, field(default=None)) for name in _RESULT_FIELDS],
+        frozen=True, slots=True
+    )
+
+    @dataclass(frozen=True, slots=True)
+    class ExaResponse:
+        """Resposta de busca da Exa API"""
+        results: Optional[Tuple[ExaResult, ...]] = None
+        autoprompt_string: Any = None
+
+    _RESULT_KEYS = tuple((name, _camel(name)) for name in _RESULT_FIELDS)
+
+    def _decode_response(raw: bytes) -> ExaResponse:
+        """Decodifica a resposta com o json padrão nas mesmas estruturas usadas com msgspec"""
+        data = json.loads(raw)
+        results = data.get('results')
+        return ExaResponse(
+            results=None if results is None else tuple(
+                ExaResult(**{name: item.get(key) for name, key in _RESULT_KEYS})
+                for item in results
+            ),
+            autoprompt_string=data.get('autopromptString')
+        )
+
+    _decode_json = json.loads
+
+
+def _str_field(value: Any) -> str:
+    """Valor textual de um campo do resultado ('' quando ausente ou de outro tipo)"""
+    return value if isinstance(value, str) else ''
+
+
+def _score_field(value: Any) -> float:
+    """Score numérico de um resultado (0 quando ausente ou de outro tipo)"""
+    return value if isinstance(value, (int, float)) and not isinstance(value, bool) else 0
+
+
+def _has_min_text(result: ExaResult, min_chars: int = 100) -> bool:
+    """Verifica se o resultado tem conteúdo textual mínimo (considerando o limite de 2000 caracteres)"""
+    return len(_str_field(result.text)[:2000].strip()) >= min_chars
+
+
+def _process_neural_result(result: ExaResult) -> Dict[str, Any]:
+    """Converte um resultado da API no formato da busca comprehensive"""
+    score = _score_field(result.score)
+    return {
+        'title': _str_field(result.title) or 'Sem título',
+        'url': _str_field(result.url),
+        'text': _str_field(result.text)[:2000],  # Limita texto
+        'score': score,
+        'published_date': result.published_date,
+        'author': result.author,
+        'source': 'exa_neural',
+        'relevance_score': score * 100
+    }
+
+
+def _process_basic_result(result: ExaResult) -> Dict[str, Any]:
+    """Converte um resultado da API no formato da busca básica"""
+    return {
+        'title': _str_field(result.title) or 'Sem título',
+        'url': _str_field(result.url),
+        'text': '',  # Busca básica não retorna texto
+        'score': _score_field(result.score),
+        'source': 'exa_basic'
+    }
+
+
+# Atributo da requisição -> campo da Exa API
+_PAYLOAD_FIELDS = (
+    ("query", "query"),
+    ("num_results", "numResults"),
+    ("use_autoprompt", "useAutoprompt"),
+    ("type", "type"),
+    ("include_domains", "includeDomains"),
+    ("exclude_domains", "excludeDomains"),
+    ("start_crawl_date", "startCrawlDate"),
+    ("end_crawl_date", "endCrawlDate"),
+    ("start_published_date", "startPublishedDate"),
+    ("end_published_date", "endPublishedDate")
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ExaSearchRequest:
+    """Parâmetros de uma busca na Exa API"""
+    query: str
+    num_results: int = 10
+    use_autoprompt: Optional[bool] = True
+    type: Optional[str] = "neural"
+    include_domains: Tuple[str, ...] = ()
+    exclude_domains: Tuple[str, ...] = ()
+    start_crawl_date: Optional[str] = None
+    end_crawl_date: Optional[str] = None
+    start_published_date: Optional[str] = None
+    end_published_date: Optional[str] = None
+    max_characters: Optional[int] = None  # Quando informado, inclui o texto das páginas
+
+    def to_payload(self) -> Dict[str, Any]:
+        """Converte para o payload da API, omitindo campos não informados"""
+        payload = {
+            api_field: value
+            for attr, api_field in _PAYLOAD_FIELDS
+            if (value := getattr(self, attr)) is not None and value != ()
+        }
+        if self.max_characters is not None:
+            payload["contents"] = {"text": {"maxCharacters": self.max_characters}}
+        return payload
+
+
+def _neural_request(query: str, num_results: int, opts: Dict[str, Any]) -> ExaSearchRequest:
+    """Busca neural padrão (search)"""
+    return ExaSearchRequest(
+        query=query,
+        num_results=num_results,
+        use_autoprompt=opts.get("use_autoprompt", True),
+        type=opts.get("type", "neural"),
+        include_domains=tuple(opts.get("include_domains") or ()),
+        exclude_domains=tuple(opts.get("exclude_domains") or ()),
+        start_crawl_date=opts.get("start_crawl_date"),
+        end_crawl_date=opts.get("end_crawl_date"),
+        start_published_date=opts.get("start_published_date"),
+        end_published_date=opts.get("end_published_date")
+    )
+
+
+def _comprehensive_request(query: str, num_results: int, opts: Dict[str, Any]) -> ExaSearchRequest:
+    """Busca comprehensive: neural com conteúdo textual das páginas"""
+    return ExaSearchRequest(
+        query=query,
+        num_results=min(num_results, 20),
+        include_domains=tuple(opts.get("include_domains") or ()),
+        exclude_domains=tuple(opts.get("exclude_domains") or ()),
+        start_crawl_date=opts.get("start_date"),
+        end_crawl_date=opts.get("end_date"),
+        max_characters=opts.get("max_length", 2000)
+    )
+
+
+def _basic_request(query: str, num_results: int, opts: Dict[str, Any]) -> ExaSearchRequest:
+    """Busca básica usada como fallback"""
+    return ExaSearchRequest(query=query, num_results=min(num_results, 10), type=None)
+
+
+# Variante -> construtor da requisição
+_REQUEST_VARIANTS = {
+    "neural": _neural_request,
+    "comprehensive": _comprehensive_request,
+    "basic": _basic_request
+}
+
+
+class _ResponseCache:
+    """Cache de respostas da Exa com expiração (em disco via diskcache, ou em memória)"""
+
+    def __init__(self, directory: str, ttl: int = _CACHE_TTL, max_entries: int = 512):
+        self.ttl = ttl
+        try:
+            import diskcache
+            self._disk = diskcache.Cache(directory, size_limit=2**30)
+        except ImportError:
+            self._disk = None
+        self._memory: Dict[str, tuple] = {}
+        self._max_entries = max_entries
+
+    @staticmethod
+    def make_key(endpoint: str, data: Dict[str, Any]) -> str:
+        """Gera chave estável a partir do endpoint e do payload canonicalizado"""
+        canonical = json.dumps([endpoint, data], sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        if self._disk is not None:
+            return self._disk.get(key)
+
+        entry = self._memory.get(key)
+        if entry and time.time() - entry[0] < self.ttl:
+            return entry[1]
+        return None
+
+    def set(self, key: str, value: Any):
+        if self._disk is not None:
+            self._disk.set(key, value, expire=self.ttl)
+            return
+
+        # Descarta a entrada mais antiga quando o limite é atingido
+        if len(self._memory) >= self._max_entries:
+            self._memory.pop(next(iter(self._memory), None), None)
+        self._memory[key] = (time.time(), value)
+
+
 class ExaClient:
     """Cliente para integração com Exa API"""
 
     def __init__(self):
         """Inicializa cliente Exa"""
-        self.api_key = os.getenv("EXA_API_KEY", "a0dd63a6-0bd1-488f-a63e-2c4f4cfe969f")
+        self.api_key = os.getenv("EXA_API_KEY")
         self.base_url = "https://api.exa.ai"
 
+        # Importado sob demanda: a pilha HTTP só é carregada quando a Exa é usada
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        # Sessão com pool de conexões: evita novo handshake TCP/TLS a cada chamada
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+        # Cache de respostas: consultas repetidas entre execuções não voltam à API
+        self._cache = _ResponseCache(os.getenv("EXA_CACHE_DIR", ".exa_cache"))
+
         if self.api_key:
-            try:
-                self.client = Exa(self.api_key)
-                logger.info("✅ Exa client inicializado com sucesso")
-                self.available = True
-            except Exception as e:
-                logger.error(f"⚠️ Erro ao inicializar Exa client: {e}")
-                self.available = False
-                self.client = None
+            self._session.headers["x-api-key"] = self.api_key
+            logger.info("✅ Exa client inicializado com sucesso")
+            self.available = True
         else:
             logger.warning("⚠️ Exa API key não encontrada")
             self.available = False
-            self.client = None
 
 
     def is_available(self) -> bool:
         """Verifica se o cliente está disponível"""
         return self.available
 
+    def _build_payload(self, query: str, num_results: int, *, variant: str, **opts) -> Dict[str, Any]:
+        """Monta o payload da Exa API para a variante informada"""
+        return _REQUEST_VARIANTS[variant](query, num_results, opts).to_payload()
+
+    def _post(self, path: str, payload: Dict[str, Any]) -> bytes:
+        """Envia requisição à Exa API e retorna o corpo JSON bruto, reutilizando conexões e cache"""
+        key = self._cache.make_key(path, payload)
+        cached = self._cache.get(key)
+        if cached is not None:
+            logger.debug(f"📦 Exa cache hit: {path}")
+            return cached
+
+        response = self._session.post(self.base_url + path, json=payload, timeout=30)
+        if response.status_code != 200:
+            raise ValueError(f"Exa API retornou {response.status_code}: {response.text[:200]}")
+
+        data = response.content
+        self._cache.set(key, data)
+        return data
+
+    def _do_search(self, payload: Dict[str, Any]) -> bytes:
+        """Executa a busca; payloads com `contents` também retornam o conteúdo das páginas"""
+        return self._post("/search", payload)
+
     def search(
         self,
         query: str,
@@ -62,40 +322,23 @@ class ExaClient:
             return None
 
         try:
-            payload = {
-                "query": query,
-                "numResults": num_results,
-                "useAutoprompt": use_autoprompt,
-                "type": type
-            }
-
-            if include_domains:
-                payload["includeDomains"] = include_domains
-
-            if exclude_domains:
-                payload["excludeDomains"] = exclude_domains
-
-            if start_crawl_date:
-                payload["startCrawlDate"] = start_crawl_date
-
-            if end_crawl_date:
-                payload["endCrawlDate"] = end_crawl_date
-
-            if start_published_date:
-                payload["startPublishedDate"] = start_published_date
-
-            if end_published_date:
-                payload["endPublishedDate"] = end_published_date
-
-            response = self.client.search(**payload)
-
-            if response.status_code == 200:
-                data = response.json()
-                logger.info(f"✅ Exa search: {len(data.get('results', []))} resultados")
-                return data
-            else:
-                logger.error(f"❌ Erro Exa: {response.status_code} - {response.text}")
-                return None
+            payload = self._build_payload(
+                query,
+                num_results,
+                variant="neural",
+                include_domains=include_domains,
+                exclude_domains=exclude_domains,
+                start_crawl_date=start_crawl_date,
+                end_crawl_date=end_crawl_date,
+                start_published_date=start_published_date,
+                end_published_date=end_published_date,
+                use_autoprompt=use_autoprompt,
+                type=type
+            )
+
+            data = _decode_json(self._do_search(payload))
+            logger.info(f"✅ Exa search: {len(data.get('results', []))} resultados")
+            return data
 
         except Exception as e:
             logger.error(f"❌ Erro na requisição Exa: {str(e)}")
@@ -121,15 +364,9 @@ class ExaClient:
                 "summary": summary
             }
 
-            response = self.client.get_contents(**payload)
-
-            if response.status_code == 200:
-                data = response.json()
-                logger.info(f"✅ Exa contents: {len(data.get('results', []))} conteúdos")
-                return data
-            else:
-                logger.error(f"❌ Erro Exa contents: {response.status_code}")
-                return None
+            data = _decode_json(self._post("/contents", payload))
+            logger.info(f"✅ Exa contents: {len(data.get('results', []))} conteúdos")
+            return data
 
         except Exception as e:
             logger.error(f"❌ Erro ao obter conteúdos Exa: {str(e)}")
@@ -153,15 +390,9 @@ class ExaClient:
                 "excludeSourceDomain": exclude_source_domain
             }
 
-            response = self.client.find_similar(**payload)
-
-            if response.status_code == 200:
-                data = response.json()
-                logger.info(f"✅ Exa similar: {len(data.get('results', []))} similares")
-                return data
-            else:
-                logger.error(f"❌ Erro Exa similar: {response.status_code}")
-                return None
+            data = _decode_json(self._post("/findSimilar", payload))
+            logger.info(f"✅ Exa similar: {len(data.get('results', []))} similares")
+            return data
 
         except Exception as e:
             logger.error(f"❌ Erro ao buscar similares: {str(e)}")
@@ -180,46 +411,20 @@ class ExaClient:
                 }
 
             # Configurações avançadas para busca comprehensive
-            search_params = {
-                'query': query,
-                'num_results': min(num_results, 20),  # Limite máximo
-                'use_autoprompt': True,
-                'type': 'neural',
-                'include_domains': kwargs.get('include_domains', []),
-                'exclude_domains': kwargs.get('exclude_domains', []),
-                'start_crawl_date': kwargs.get('start_date'),
-                'end_crawl_date': kwargs.get('end_date'),
-                'include_text': True,
-                'text_length_min': kwargs.get('min_length', 200),
-                'text_length_max': kwargs.get('max_length', 2000)
-            }
-
-            # Remove parâmetros None
-            search_params = {k: v for k, v in search_params.items() if v is not None}
+            search_params = self._build_payload(query, num_results, variant="comprehensive", **kwargs)
 
             logger.info(f"🔍 Iniciando busca comprehensive Exa: {query}")
 
             # Realiza busca neural
             try:
-                response = self.client.search_and_contents(**search_params)
-
-                processed_results = []
-                if hasattr(response, 'results') and response.results:
-                    for result in response.results:
-                        processed_result = {
-                            'title': getattr(result, 'title', 'Sem título'),
-                            'url': getattr(result, 'url', ''),
-                            'text': getattr(result, 'text', '')[:2000],  # Limita texto
-                            'score': getattr(result, 'score', 0),
-                            'published_date': getattr(result, 'published_date', None),
-                            'author': getattr(result, 'author', None),
-                            'source': 'exa_neural',
-                            'relevance_score': getattr(result, 'score', 0) * 100
-                        }
-
-                        # Filtra resultados com conteúdo mínimo
-                        if len(processed_result['text'].strip()) >= 100:
-                            processed_results.append(processed_result)
+                response = _decode_response(self._do_search(search_params))
+
+                # Filtra resultados com conteúdo mínimo antes de montar cada resultado
+                processed_results = [
+                    _process_neural_result(result)
+                    for result in response.results or ()
+                    if _has_min_text(result)
+                ]
 
                 logger.info(f"✅ Exa encontrou {len(processed_results)} resultados relevantes")
 
@@ -248,27 +453,21 @@ class ExaClient:
                 'results': []
             }
 
+    def search_many(self, searches: List[Dict[str, Any]], max_workers: int = 8) -> List[Optional[Dict[str, Any]]]:
+        """Executa várias buscas (argumentos de `search`) em paralelo, preservando a ordem"""
+        if not searches:
+            return []
+
+        # Limita requisições simultâneas para respeitar o rate limit da API
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(searches))) as executor:
+            return list(executor.map(lambda params: self.search(**params), searches))
+
     def _fallback_basic_search(self, query: str, num_results: int) -> Dict[str, Any]:
         """Busca básica como fallback"""
         try:
-            basic_params = {
-                'query': query,
-                'num_results': min(num_results, 10),
-                'use_autoprompt': True
-            }
+            response = _decode_response(self._do_search(self._build_payload(query, num_results, variant="basic")))
 
-            response = self.client.search(**basic_params)
-
-            results = []
-            if hasattr(response, 'results') and response.results:
-                for result in response.results:
-                    results.append({
-                        'title': getattr(result, 'title', 'Sem título'),
-                        'url': getattr(result, 'url', ''),
-                        'text': '',  # Busca básica não retorna texto
-                        'score': getattr(result, 'score', 0),
-                        'source': 'exa_basic'
-                    })
+            results = [_process_basic_result(result) for result in response.results or ()]
 
             return {
                 'success': True,
@@ -288,5 +487,28 @@ class ExaClient:
                 'results': []
             }
 
-# Instância global
-exa_client = ExaClient()
\ No newline at end of file
+# Instância global, criada no primeiro uso
+_exa_client: Optional[ExaClient] = None
+_exa_client_lock = threading.Lock()
+
+
+def get_exa_client() -> ExaClient:
+    """Retorna a instância global do cliente Exa, criando-a na primeira chamada"""
+    global _exa_client
+    if _exa_client is None:
+        with _exa_client_lock:
+            if _exa_client is None:
+                _exa_client = ExaClient()
+    return _exa_client
+
+
+def is_exa_configured() -> bool:
+    """Indica se a chave da Exa está configurada, sem criar o cliente"""
+    return bool(_exa_client.available if _exa_client is not None else os.getenv("EXA_API_KEY"))
+
+
+def __getattr__(name: str):
+    # Compatibilidade com `from services.exa_client import exa_client`
+    if name == "exa_client":
+        return get_exa_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -18,7 +18,7 @@ from services.unified_analysis_engine import unified_analysis_engine
 
 # Importações de serviços essenciais
 from services.ai_manager import ai_manager
-from services.exa_client import exa_client
+from services.exa_client import get_exa_client
 from services.mcp_supadata_manager import mcp_supadata_manager
 from services.alibaba_websailor import AlibabaWebSailorAgent
 from services.auto_save_manager import salvar_etapa, salvar_erro
@@ -37,7 +37,6 @@ class MasterAnalysisEngine:
         }
 
         self.search_providers = {
-            'exa': exa_client,
             'supadata': mcp_supadata_manager,
             'websailor': AlibabaWebSailorAgent()
         }
@@ -195,7 +194,7 @@ class MasterAnalysisEngine:
         try:
             # 1. Busca com EXA (prioridade 1)
             logger.info("🔍 Executando busca EXA...")
-            exa_data = exa_client.search(
+            exa_data = get_exa_client().search(
                 query=query,
                 num_results=20,
                 use_autoprompt=True,
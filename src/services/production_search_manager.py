@@ -14,7 +14,7 @@ from urllib.parse import quote_plus
 from bs4 import BeautifulSoup
 import json
 import random
-from services.exa_client import exa_client
+from services.exa_client import get_exa_client, is_exa_configured
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -26,11 +26,10 @@ class ProductionSearchManager:
         """Inicializa o gerenciador de busca"""
         self.providers = {
             'exa': {
-                'enabled': exa_client.is_available(),
+                'enabled': is_exa_configured(),
                 'priority': 1,  # Prioridade máxima
                 'error_count': 0,
                 'max_errors': 3,
-                'client': exa_client
             },
             'google': {
                 'enabled': bool(os.getenv('GOOGLE_SEARCH_KEY') and os.getenv('GOOGLE_CSE_ID')),
@@ -343,7 +342,7 @@ class ProductionSearchManager:
             ]
 
             # Aumenta o espectro de datas e usa autoprompt
-            exa_response = exa_client.search(
+            exa_response = get_exa_client().search(
                 query=enhanced_query,
                 num_results=max_results,
                 include_domains=include_domains,
@@ -411,7 +410,7 @@ class ProductionSearchManager:
             # 1. Exa Search (neural) - Prioridade alta
             try:
                 logger.info("🧠 Tentando busca neural Exa...")
-                exa_results = self.exa_client.search_comprehensive(
+                exa_results = get_exa_client().search_comprehensive(
                     query, 
                     num_results=min(8, num_results),
                     min_length=300,
@@ -11,7 +11,7 @@ import time
 import json
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
-from services.exa_client import exa_client
+from services.exa_client import get_exa_client
 from services.mcp_supadata_manager import mcp_supadata_manager
 from services.auto_save_manager import salvar_etapa, salvar_erro
 
@@ -20,6 +20,14 @@ logger = logging.getLogger(__name__)
 class SocialMediaGuaranteedExtractor:
     """Extrator garantido de redes sociais usando EXA e SUPADATA"""
 
+    # Plataforma -> (nome exibido no log, filtro de site da query EXA)
+    _EXA_PLATFORMS = (
+        ('youtube', 'YouTube', 'site:youtube.com OR site:youtu.be'),
+        ('instagram', 'Instagram', 'site:instagram.com'),
+        ('tiktok', 'TikTok', 'site:tiktok.com'),
+        ('twitter', 'Twitter', 'site:twitter.com OR site:x.com'),
+    )
+
     def __init__(self):
         """Inicializa o extrator garantido"""
         self.platforms = {
@@ -109,104 +117,36 @@ class SocialMediaGuaranteedExtractor:
         }
 
         try:
-            # Busca específica para YouTube
-            youtube_query = f"{query} site:youtube.com OR site:youtu.be"
-            youtube_data = exa_client.search(
-                query=youtube_query,
-                num_results=max_results,
-                use_autoprompt=True,
-                type="neural",
-                include_domains=['youtube.com', 'youtu.be']
-            )
-
-            if youtube_data and 'results' in youtube_data:
-                exa_results['youtube_data'] = [
-                    {
-                        'url': result.get('url', ''),
-                        'title': result.get('title', ''),
-                        'text': result.get('text', '')[:500],
-                        'platform': 'youtube',
-                        'extracted_at': datetime.now().isoformat()
-                    }
-                    for result in youtube_data['results']
-                ]
-                logger.info(f"✅ EXA YouTube: {len(exa_results['youtube_data'])} resultados")
-
-            # Busca para Instagram
-            instagram_query = f"{query} site:instagram.com"
-            instagram_data = exa_client.search(
-                query=instagram_query,
-                num_results=max_results,
-                use_autoprompt=True,
-                type="neural",
-                include_domains=['instagram.com']
-            )
-
-            if instagram_data and 'results' in instagram_data:
-                exa_results['instagram_data'] = [
-                    {
-                        'url': result.get('url', ''),
-                        'title': result.get('title', ''),
-                        'text': result.get('text', '')[:500],
-                        'platform': 'instagram',
-                        'extracted_at': datetime.now().isoformat()
-                    }
-                    for result in instagram_data['results']
-                ]
-                logger.info(f"✅ EXA Instagram: {len(exa_results['instagram_data'])} resultados")
-
-            # Busca para TikTok
-            tiktok_query = f"{query} site:tiktok.com"
-            tiktok_data = exa_client.search(
-                query=tiktok_query,
-                num_results=max_results,
-                use_autoprompt=True,
-                type="neural",
-                include_domains=['tiktok.com']
-            )
-
-            if tiktok_data and 'results' in tiktok_data:
-                exa_results['tiktok_data'] = [
-                    {
-                        'url': result.get('url', ''),
-                        'title': result.get('title', ''),
-                        'text': result.get('text', '')[:500],
-                        'platform': 'tiktok',
-                        'extracted_at': datetime.now().isoformat()
-                    }
-                    for result in tiktok_data['results']
-                ]
-                logger.info(f"✅ EXA TikTok: {len(exa_results['tiktok_data'])} resultados")
-
-            # Busca para Twitter/X
-            twitter_query = f"{query} site:twitter.com OR site:x.com"
-            twitter_data = exa_client.search(
-                query=twitter_query,
-                num_results=max_results,
-                use_autoprompt=True,
-                type="neural",
-                include_domains=['twitter.com', 'x.com']
-            )
-
-            if twitter_data and 'results' in twitter_data:
-                exa_results['twitter_data'] = [
-                    {
-                        'url': result.get('url', ''),
-                        'title': result.get('title', ''),
-                        'text': result.get('text', '')[:500],
-                        'platform': 'twitter',
-                        'extracted_at': datetime.now().isoformat()
-                    }
-                    for result in twitter_data['results']
-                ]
-                logger.info(f"✅ EXA Twitter: {len(exa_results['twitter_data'])} resultados")
+            # Buscas independentes por plataforma, executadas em paralelo
+            platforms = self._EXA_PLATFORMS
+            responses = get_exa_client().search_many([
+                {
+                    'query': f"{query} {site_filter}",
+                    'num_results': max_results,
+                    'use_autoprompt': True,
+                    'type': "neural",
+                    'include_domains': self.platforms[platform]
+                }
+                for platform, _, site_filter in platforms
+            ])
+
+            for (platform, label, _), response in zip(platforms, responses):
+                if response and 'results' in response:
+                    exa_results[f'{platform}_data'] = [
+                        {
+                            'url': result.get('url', ''),
+                            'title': result.get('title', ''),
+                            'text': result.get('text', '')[:500],
+                            'platform': platform,
+                            'extracted_at': datetime.now().isoformat()
+                        }
+                        for result in response['results']
+                    ]
+                    logger.info(f"✅ EXA {label}: {len(exa_results[f'{platform}_data'])} resultados")
 
             # Calcula total
-            exa_results['total_exa_results'] = (
-                len(exa_results['youtube_data']) +
-                len(exa_results['instagram_data']) +
-                len(exa_results['tiktok_data']) +
-                len(exa_results['twitter_data'])
+            exa_results['total_exa_results'] = sum(
+                len(exa_results[f'{platform}_data']) for platform, _, _ in platforms
             )
 
         except Exception as e:
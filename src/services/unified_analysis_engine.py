@@ -14,7 +14,7 @@ from services.ai_manager import ai_manager
 from services.unified_search_manager import unified_search_manager
 from services.robust_content_extractor import robust_content_extractor
 from services.pymupdf_client import pymupdf_client
-from services.exa_client import exa_client
+from services.exa_client import is_exa_configured
 from services.mental_drivers_architect import mental_drivers_architect
 from services.visual_proofs_generator import visual_proofs_generator
 from services.anti_objection_system import anti_objection_system
@@ -277,7 +277,7 @@ class UnifiedAnalysisEngine:
             'providers_used': len(search_results.get('provider_results', {})),
             'total_sources': search_results.get('statistics', {}).get('total_results', 0),
             'brazilian_sources': search_results.get('statistics', {}).get('brazilian_sources', 0),
-            'exa_enhanced': exa_client.is_available(),
+            'exa_enhanced': is_exa_configured(),
             'pymupdf_pro': pymupdf_client.is_available(),
             'analysis_completeness': 'MAXIMUM'
         }
@@ -725,7 +725,7 @@ CRÍTICO: Use APENAS dados REAIS da pesquisa unificada. Combine insights de toda
             'extraction_capabilities': {
                 'web_extraction': robust_content_extractor is not None,
                 'pdf_extraction': pymupdf_client.is_available(),
-                'exa_neural_search': exa_client.is_available()
+                'exa_neural_search': is_exa_configured()
             },
             'ai_providers': ai_manager.get_provider_status() if ai_manager else {}
         }
@@ -15,7 +15,7 @@ from bs4 import BeautifulSoup
 import json
 import random
 from datetime import datetime
-from services.exa_client import exa_client
+from services.exa_client import get_exa_client, is_exa_configured
 from services.auto_save_manager import salvar_etapa, salvar_erro
 
 logger = logging.getLogger(__name__)
@@ -27,11 +27,10 @@ class UnifiedSearchManager:
         """Inicializa o gerenciador unificado"""
         self.providers = {
             'exa': {
-                'enabled': exa_client.is_available(),
+                'enabled': is_exa_configured(),
                 'priority': 1,  # Prioridade máxima - EXA PRIMEIRO
                 'error_count': 0,
                 'max_errors': 3,
-                'client': exa_client
             },
             'alibaba_websailor': {
                 'enabled': True,  # SEGUNDO - Alibaba WebSailor
@@ -185,8 +184,8 @@ class UnifiedSearchManager:
     def _search_with_exa(self, query: str, max_results: int) -> List[Dict]:
         """Busca com Exa API (prioridade 1)"""
         try:
-            from services.exa_client import exa_client
-            return exa_client.search(query, max_results)
+            from services.exa_client import get_exa_client
+            return get_exa_client().search(query, max_results)
         except Exception as e:
             logger.warning(f"Exa não disponível: {e}")
             return []
@@ -242,7 +241,7 @@ class UnifiedSearchManager:
     def _search_with_exa_optimized(self, query: str, max_results: int, context: Dict[str, Any] = None) -> List[Dict]:
         """Busca otimizada com Exa AI (PRIORIDADE 2)"""
         try:
-            from services.exa_client import exa_client
+            from services.exa_client import get_exa_client
             
             # Configura busca com parâmetros otimizados
             enhanced_query = self._enhance_query_for_brazil(query)
@@ -254,7 +253,7 @@ class UnifiedSearchManager:
                 "revistapegn.globo.com", "epocanegocios.globo.com"
             ]
             
-            exa_response = exa_client.search(
+            exa_response = get_exa_client().search(
                 query=enhanced_query,
                 num_results=max_results,
                 include_domains=include_domains,
@@ -396,7 +395,7 @@ class UnifiedSearchManager:
             include_domains = self.preferred_domains if context else None
 
             # Busca com Exa
-            exa_response = exa_client.search(
+            exa_response = get_exa_client().search(
                 query=enhanced_query,
                 num_results=max_results,
                 include_domains=include_domains,